@@ -1,14 +1,15 @@
-import pandas as pd
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+import asyncio
+
+from fastapi import FastAPI, Path, Query, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from exceptions.exceptions import DataNotFoundExceptionError, BadMetricError
-from models.power_plant import TopPlantsRequest, StateFilterRequest, \
-    TopPowerPlantList, StatesInfoRequest, StateSummary, DataFrameModel
+from models.power_plant import TopPowerPlantList, StateSummary, DataFrameModel
 from services.data_handler import PowerPlantDataHandler
+from services.data_loader import load_sheet
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 Instrumentator().instrument(app).expose(app)
 
 data_handler: PowerPlantDataHandler
@@ -19,9 +20,12 @@ async def load_data():
     global data_handler
     try:
         file_path = "data/eGRID2021_data.xlsx"
-        plant_data = pd.read_excel(file_path, sheet_name="PLNT21")
-        state_data = pd.read_excel(file_path, sheet_name="ST21")
-        data_handler = PowerPlantDataHandler(plant_data=plant_data, state_data=state_data)
+        # The sheets are independent, so they are loaded concurrently in worker threads
+        plant_data, state_data = await asyncio.gather(
+            asyncio.to_thread(load_sheet, file_path, "PLNT21"),
+            asyncio.to_thread(load_sheet, file_path, "ST21"),
+        )
+        data_handler = PowerPlantDataHandler(plant_data=plant_data, state_data=state_data, clean=False)
     except FileNotFoundError as e:
         raise DataNotFoundExceptionError from e
 
@@ -32,18 +36,35 @@ async def root():
 
 
 @app.get("/plants/top", response_model=TopPowerPlantList)
-async def get_top_n_plants(request: TopPlantsRequest) -> TopPowerPlantList:
-    return data_handler.get_top_n_plants(request.top_number, request.metric)
+async def get_top_n_plants(
+    top_number: int = Query(..., description="Number of top plants to retrieve", gt=0),
+    metric: str = Query("Plant annual net generation (MWh)", description="Column to sort by"),
+) -> ORJSONResponse:
+    return ORJSONResponse(content=data_handler.get_top_n_plants(top_number, metric))
 
 
 @app.get("/plants/states", response_model=StateSummary)
-async def get_states_info(request: StatesInfoRequest) -> StateSummary:
-    return data_handler.get_plant_metric_summary_by_state(request.metric)
+async def get_states_info(
+    metric: str = Query(..., description="Column to aggregate by"),
+) -> Response:
+    return Response(
+        content=data_handler.get_plant_metric_summary_by_state(metric), media_type="application/json"
+    )
 
 
 @app.get("/plants/state/{state}", response_model=DataFrameModel)
-async def get_plants_by_state(request: StateFilterRequest) -> DataFrameModel:
-    return data_handler.get_data_by_state(request.state)
+async def get_plants_by_state(
+    state: str = Path(
+        ...,
+        description="State abbreviation to filter by",
+        min_length=2,
+        max_length=2,
+        pattern="^[A-Za-z]+$",
+    ),
+) -> Response:
+    return Response(
+        content=data_handler.get_data_by_state(state.upper()), media_type="application/json"
+    )
 
 
 @app.get("/health")
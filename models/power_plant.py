@@ -2,13 +2,12 @@
 This module defines various Pydantic models used to represent power plant data.
 
 It includes classes for individual power plants, lists of power plants, state-specific plant information,
-requests for top plants and state filter, and a model for handling pandas DataFrame.
+and a model for the records of a pandas DataFrame. They describe the API responses.
 """
 
 from typing import List
 
-import pandas as pd
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel
 
 
 class TopPowerPlant(BaseModel):
@@ -89,103 +88,11 @@ class StateSummary(BaseModel):
     summary: List[StateSummaryItem]
 
 
-class TopPlantsRequest(BaseModel):
-    """
-    A class used to represent a request for top plants.
-
-    Attributes:
-        top_number (int): The number of top plants to retrieve.
-        metric (str): The metric to sort by.
-    """
-    top_number: int = Field(..., description="Number of top plants to retrieve", gt=0)
-    # metric: str = Field(..., description="Column to sort by")
-    metric: str = "Plant annual net generation (MWh)"
-
-    @field_validator("top_number")
-    def validate_number(cls, value):  # pylint: disable=no-self-argument
-        """
-        Validates the number of top plants to retrieve.
-
-        Args:
-            value (int): The number of top plants to retrieve.
-
-        Returns:
-            int: The validated number of top plants to retrieve.
-
-        Raises:
-            ValueError: If the number of top plants to retrieve is less than or equal to 0.
-        """
-        if value <= 0:
-            raise ValueError("top_number must be greater than 0")
-        return value
-
-
-class StateFilterRequest(BaseModel):
-    """
-    A class used to represent a state filter request.
-
-    Attributes:
-        state (str): The state abbreviation to filter by.
-    """
-    state: str = Field(..., description="State abbreviation to filter by", min_length=2, max_length=2)
-
-    @field_validator("state")
-    def validate_state(cls, value):  # pylint: disable=no-self-argument
-        """
-        Validates the state abbreviation to filter by.
-
-        Args:
-            value (str): The state abbreviation to filter by.
-
-        Returns:
-            str: The validated and uppercased state abbreviation to filter by.
-
-        Raises:
-            ValueError: If the state abbreviation contains non-alphabetic characters.
-        """
-        if not value.isalpha():
-            raise ValueError("State must contain only alphabetic characters")
-        return value.upper()
-
-
-class StatesInfoRequest(BaseModel):
-    """
-    A class used to represent a states info request.
-
-    Attributes:
-        metric (str): The metric to aggregate by.
-    """
-    metric: str = Field(..., description="Column to aggregate by")
-
-
 class DataFrameModel(BaseModel):
     """
     A class used to represent a DataFrame model.
 
     Attributes:
-        data (List[dict]): The data in the DataFrame
-    Methods:
-           validate_and_convert_dataframe: Validates and converts the data to a DataFrame.
-       """
+        data (List[dict]): The records of the DataFrame.
+    """
     data: List[dict]
-
-    @model_validator(mode='before')
-    def validate_and_convert_dataframe(cls, values):  # pylint: disable=no-self-argument
-        """
-        Validates and converts the data to a DataFrame.
-
-        Args:
-            values (dict): The values in the DataFrame.
-
-        Returns:
-            dict: The validated and converted DataFrame.
-
-        Raises:
-            ValueError: If the data is not a DataFrame or a list of dictionaries.
-        """
-        if 'data' in values and isinstance(values['data'], pd.DataFrame):
-            return {'data': values['data'].to_dict(orient='records')}
-        if 'data' in values and isinstance(values['data'], list):
-            return values
-
-        raise ValueError('Data must be a DataFrame or a list of dictionaries')
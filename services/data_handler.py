@@ -4,19 +4,13 @@ getting the top N plants based on a specified metric, getting a summary of the d
 the data by state.
 """
 
-from typing import List
+from typing import Any, Dict, List
 
+import numpy as np
+import orjson
 import pandas as pd
-from pydantic import TypeAdapter
 
 from exceptions.exceptions import DataNotFoundExceptionError, BadMetricError
-from models.power_plant import (
-    TopPowerPlant,
-    TopPowerPlantList,
-    StateSummaryItem,
-    StateSummary,
-    DataFrameModel,
-)
 from util.data_cleaner import DataCleaner
 
 
@@ -26,13 +20,40 @@ class PowerPlantDataHandler:
 
      Attributes:
          plant_data (pd.DataFrame): The power plant data.
+         state_data (pd.DataFrame): The state level data.
      """
 
-    def __init__(self, plant_data: pd.DataFrame, state_data: pd.DataFrame) -> None:
-        self.plant_data: pd.DataFrame = DataCleaner(plant_data).clean_data()
-        self.state_data: pd.DataFrame = DataCleaner(state_data).clean_data()
+    def __init__(self, plant_data: pd.DataFrame, state_data: pd.DataFrame, clean: bool = True) -> None:
+        """
+        Initializes the handler and pre-computes the per-state and state summary payloads.
 
-    def get_top_n_plants(self, top_number: int, metric: str) -> TopPowerPlantList:
+        Args:
+            plant_data (pd.DataFrame): The power plant data.
+            state_data (pd.DataFrame): The state level data.
+            clean (bool): Whether the data still has to be cleaned. False for data that was already cleaned.
+        """
+        self.plant_data: pd.DataFrame = DataCleaner(plant_data).clean_data() if clean else plant_data
+        self.state_data: pd.DataFrame = DataCleaner(state_data).clean_data() if clean else state_data
+
+        # The data never changes after loading, so the per-state payloads are serialized once up front
+        self._state_json: Dict[str, bytes] = {
+            str(state): orjson.dumps(
+                {"data": plants.to_dict(orient="records")},
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            )
+            for state, plants in self.plant_data.groupby("Plant state abbreviation", sort=False)
+        }
+        # Descending row order per metric, sorted on first use and reused by every later request
+        self._top_order: Dict[str, np.ndarray] = {}
+        # The state summary of every plant metric with state level data, serialized once up front
+        self._summary_json: Dict[str, bytes] = {}
+        for plant_metric in self.plant_data.columns:
+            try:
+                self._summary_json[plant_metric] = orjson.dumps(self._compute_state_summary(plant_metric))
+            except BadMetricError:
+                continue
+
+    def get_top_n_plants(self, top_number: int, metric: str) -> Dict[str, List[Dict[str, Any]]]:
         """
             Gets the top N plants based on a specified metric.
 
@@ -41,35 +62,53 @@ class PowerPlantDataHandler:
                 metric (str): The metric to sort by.
 
             Returns:
-                TopPowerPlantList: A list of the top N plants.
+                Dict[str, List[Dict[str, Any]]]: The top N plants, shaped like a TopPowerPlantList.
         """
-        if metric not in self.plant_data.columns:
-            raise BadMetricError(f"The specified metric '{metric}' does not exist.")
+        order = self._top_order.get(metric)
+        if order is None:
+            if metric not in self.plant_data.columns:
+                raise BadMetricError(f"The specified metric '{metric}' does not exist.")
 
-        if pd.api.types.is_numeric_dtype(self.plant_data[metric]):
-            # Sorting the data by the specified column in descending order
-            top_n_plants = self.plant_data.sort_values(by=metric, ascending=False).head(
-                top_number
-            )
-        else:
-            raise BadMetricError(
-                f"The specified metric '{metric}' is not numerical and cannot be used for sorting. "
-                f"Please choose a numerical column."
-            )
+            if not pd.api.types.is_numeric_dtype(self.plant_data[metric]):
+                raise BadMetricError(
+                    f"The specified metric '{metric}' is not numerical and cannot be used for sorting. "
+                    f"Please choose a numerical column."
+                )
+
+            # A stable sort of the negated values orders descending while keeping ties in row order
+            order = np.argsort(-self.plant_data[metric].to_numpy(dtype="float64"), kind="stable")
+            self._top_order[metric] = order
+
+        top_n_plants = self.plant_data.iloc[order[:top_number]]
 
         plants = [
-            TopPowerPlant(
-                name=row["Plant name"],
-                state=row["Plant state abbreviation"],
-                metric=metric,
-                metric_value=row[metric],
+            {"name": name, "state": state, "metric": metric, "metric_value": float(value)}
+            for name, state, value in zip(
+                top_n_plants["Plant name"].to_numpy(),
+                top_n_plants["Plant state abbreviation"].to_numpy(),
+                top_n_plants[metric].to_numpy(),
             )
-            for _, row in top_n_plants.iterrows()
         ]
 
-        return TopPowerPlantList(plants=plants)
+        return {"plants": plants}
 
-    def get_plant_metric_summary_by_state(self, plant_metric: str) -> StateSummary:
+    def get_plant_metric_summary_by_state(self, plant_metric: str) -> bytes:
+        """
+        Gets the pre-computed summary of a specific plant metric within each federal state.
+
+        Args:
+            plant_metric (str): The name of the plant metric column to be summarized.
+
+        Returns:
+            bytes: The JSON encoded summary of the specified plant metric, shaped like a StateSummary.
+        """
+        summary_json = self._summary_json.get(plant_metric)
+        if summary_json is None:
+            # Only metrics without a valid summary are missing, so computing it raises the descriptive BadMetricError
+            summary_json = orjson.dumps(self._compute_state_summary(plant_metric))
+        return summary_json
+
+    def _compute_state_summary(self, plant_metric: str) -> Dict[str, List[Dict[str, Any]]]:
         """
            Calculate and summarize the absolute value and percentage of a specific plant metric within each federal
            state.
@@ -83,8 +122,8 @@ class PowerPlantDataHandler:
                                based on the naming pattern, replacing "Plant" with "State" in the column name.
 
            Returns:
-           StateSummary: An object containing a summary of the absolute value and percentage of the specified plant metric
-                         within each federal state.
+           Dict[str, List[Dict[str, Any]]]: A summary of the absolute value and percentage of the specified plant metric
+                                            within each federal state, shaped like a StateSummary.
         """
         # Deduce the corresponding state metric by replacing the prefix "Plant" with "State"
         state_metric = plant_metric.replace("Plant", "State")
@@ -106,36 +145,36 @@ class PowerPlantDataHandler:
                 f"Sorry. We do not have state level numerical data for this metric {plant_metric}."
             )
 
-        # Merge the plant data with the state-level data based on the state abbreviation
-        merged_data = self.plant_data.merge(
-            self.state_data[['State abbreviation', state_metric]],
-            how='left',
-            left_on='Plant state abbreviation',
-            right_on='State abbreviation'
-        )
-
-        # Calculate the percentage of each plant's metric within its federal state
-        merged_data['percentage'] = (merged_data[plant_metric] / merged_data[state_metric]) * 100
-
-        # Group by state abbreviation and summarize
-        state_summary = merged_data.groupby('Plant state abbreviation').agg({
-            plant_metric: 'sum',
-            'percentage': 'sum'
-        }).reset_index()
-
-        # Rename columns
-        state_summary.rename(columns={
-            plant_metric: 'absolute_value',
-            'Plant state abbreviation': 'plant_state_abbreviation'
-        }, inplace=True)
-        state_summary["metric"] = plant_metric  # Use the plant metric as the summary metric
-
-        summary_list = state_summary.to_dict(orient="records")
-        result = TypeAdapter(List[StateSummaryItem]).validate_python(summary_list)
+        # Look up each plant's state total through the state abbreviation instead of merging whole frames
+        plant_states = self.plant_data["Plant state abbreviation"]
+        state_totals = plant_states.map(self.state_data.set_index("State abbreviation")[state_metric])
+        plant_values = self.plant_data[plant_metric].to_numpy(dtype="float64", na_value=np.nan)
+
+        # Calculate the percentage of each plant's metric within its federal state, skipping unknown or zero totals
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percentages = plant_values / state_totals.to_numpy(dtype="float64", na_value=np.nan) * 100
+        percentages[~np.isfinite(percentages)] = 0
+
+        # Sum both values per state in a single pass over the state codes
+        codes, states = pd.factorize(plant_states, sort=True)
+        absolute_values = np.bincount(codes, weights=plant_values, minlength=len(states))
+        percentage_sums = np.bincount(codes, weights=percentages, minlength=len(states))
+
+        summary = [
+            {
+                "plant_state_abbreviation": state,
+                "metric": plant_metric,
+                "absolute_value": absolute_value,
+                "percentage": percentage,
+            }
+            for state, absolute_value, percentage in zip(
+                states.tolist(), absolute_values.tolist(), percentage_sums.tolist()
+            )
+        ]
 
-        return StateSummary(summary=result)
+        return {"summary": summary}
 
-    def get_data_by_state(self, state: str) -> DataFrameModel:
+    def get_data_by_state(self, state: str) -> bytes:
         """
         Filters the data by the given state.
 
@@ -143,11 +182,9 @@ class PowerPlantDataHandler:
             state (str): The state abbreviation to filter by.
 
         Returns:
-            pd.DataFrame: A dataframe containing only the data for the specified state.
+            bytes: The JSON encoded plants of the specified state, shaped like a DataFrameModel.
         """
-        if state not in self.plant_data["Plant state abbreviation"].values:
-            raise DataNotFoundExceptionError(f"No data found for the state '{state}'")
-
-        filtered_data = self.plant_data[self.plant_data["Plant state abbreviation"] == state]
-
-        return DataFrameModel(data=filtered_data.to_dict(orient="records"))
+        try:
+            return self._state_json[state]
+        except KeyError as error:
+            raise DataNotFoundExceptionError(f"No data found for the state '{state}'") from error
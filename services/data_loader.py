@@ -0,0 +1,66 @@
+"""
+This module provides a function for loading cleaned worksheets of the eGRID workbook. The cleaned data of every
+worksheet is cached as a parquet file next to the workbook, so later startups skip parsing and cleaning the Excel file.
+The cache file name contains a hash of the cleaner's source, so changing the cleaning logic invalidates it.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from util import data_cleaner
+from util.data_cleaner import DataCleaner
+
+CLEANER_HASH = hashlib.sha256(Path(data_cleaner.__file__).read_bytes()).hexdigest()[:12]
+
+
+def _cache_path(workbook: Path, sheet_name: str) -> Path:
+    """
+    Builds the path of the parquet cache of a worksheet for the current cleaner.
+
+    Args:
+        workbook (Path): The path of the Excel workbook.
+        sheet_name (str): The name of the worksheet.
+
+    Returns:
+        Path: The path of the parquet cache next to the workbook.
+    """
+    return workbook.with_name(f"{workbook.stem}.{sheet_name}.{CLEANER_HASH}.parquet")
+
+
+def load_sheet(file_path: str, sheet_name: str) -> pd.DataFrame:
+    """
+    Loads the cleaned data of a worksheet, from its parquet cache if it is newer than the workbook and was
+    written by the current cleaner.
+
+    Args:
+        file_path (str): The path of the Excel workbook.
+        sheet_name (str): The name of the worksheet to load.
+
+    Returns:
+        pd.DataFrame: The cleaned data of the worksheet.
+
+    Raises:
+        FileNotFoundError: If the workbook does not exist.
+    """
+    workbook = Path(file_path)
+    cache = _cache_path(workbook, sheet_name)
+    workbook_mtime = workbook.stat().st_mtime
+
+    if cache.exists() and cache.stat().st_mtime > workbook_mtime:
+        return pd.read_parquet(cache, dtype_backend="pyarrow")
+
+    data = DataCleaner(pd.read_excel(workbook, sheet_name=sheet_name, engine="calamine")).clean_data()
+
+    # The cache is only an optimisation, so failing to write it must not fail the startup
+    partial_cache = cache.with_suffix(".parquet.tmp")
+    try:
+        data.to_parquet(partial_cache)
+        os.replace(partial_cache, cache)
+    except (OSError, pa.ArrowException):
+        partial_cache.unlink(missing_ok=True)
+
+    return data
@@ -24,12 +24,37 @@ def test_convert_to_numerical():
     result = DataCleaner._convert_to_numerical(col)
     assert (result == [1000.0, 2000.0]).all()
 
+def test_convert_to_numerical_mixed_types():
+    col = pd.Series([1.5, "2,000", 3, None], dtype=object)
+    result = DataCleaner._convert_to_numerical(col)
+    assert result.dtype == "float64"
+    assert result.iloc[:3].tolist() == [1.5, 2000.0, 3.0]
+    assert pd.isna(result.iloc[3])
+
+def test_convert_to_numerical_padded_strings():
+    col = pd.Series([" 12", "13 ", "1,000"])
+    result = DataCleaner._convert_to_numerical(col)
+    assert result.tolist() == [12.0, 13.0, 1000.0]
+
 def test_convert_columns_to_numerical():
     df = pd.DataFrame({"A": ["1,000", "2,000"]})
     cleaner = DataCleaner(df)
     cleaner._convert_columns_to_numerical()
     assert cleaner.data["A"].dtype == "float64"
 
+def test_convert_columns_to_numerical_skips_text():
+    df = pd.DataFrame({"A": ["1,000", "2,000"], "B": ["CA", "NY"]})
+    cleaner = DataCleaner(df)
+    cleaner._convert_columns_to_numerical()
+    assert cleaner.data["A"].dtype == "float64"
+    assert (cleaner.data["B"] == ["CA", "NY"]).all()
+
+def test_convert_columns_to_numerical_loose_samples():
+    df = pd.DataFrame({"A": ["-1,234.5", "1.", "1e3", " 12", "13 "]})
+    cleaner = DataCleaner(df)
+    cleaner._convert_columns_to_numerical()
+    assert cleaner.data["A"].tolist() == [-1234.5, 1.0, 1000.0, 12.0, 13.0]
+
 def test_fill_missing_values():
     df = pd.DataFrame({"A": [1, None], "B": [None, "value"]})
     cleaner = DataCleaner(df)
@@ -43,11 +68,18 @@ def test_remove_duplicates():
     cleaner._remove_duplicates()
     assert cleaner.data.shape[0] == 1
 
+def test_convert_to_arrow_dtypes():
+    df = pd.DataFrame({"A": [1.0, 2.0], "B": ["CA", "NY"]})
+    cleaner = DataCleaner(df)
+    cleaner._convert_to_arrow_dtypes()
+    assert cleaner.data["A"].dtype == "double[pyarrow]"
+    assert isinstance(cleaner.data["B"].dtype, pd.ArrowDtype)
+
 def test_clean_data():
     df = pd.DataFrame({"A": ["1,000", "1,000"], "percent_val": ["10%", "10%"], "B": [None, None]})
     cleaner = DataCleaner(df)
     cleaned_data = cleaner.clean_data()
     assert cleaned_data.shape[0] == 1
-    assert cleaned_data["A"].dtype == "float64"
+    assert cleaned_data["A"].dtype == "double[pyarrow]"
     assert (cleaned_data["percent_val"] == 0.1).all()
     assert (cleaned_data["B"] == 0).all()
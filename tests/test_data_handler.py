@@ -1,7 +1,8 @@
+import orjson
 import pandas as pd
 import pytest
 
-from exceptions.exceptions import BadMetricError
+from exceptions.exceptions import BadMetricError, DataNotFoundExceptionError
 from services.data_handler import PowerPlantDataHandler
 
 
@@ -25,19 +26,46 @@ def sample_data():
 # Test cases using the sample_data fixture
 class TestPowerPlantDataHandler:
 
+    def test_get_top_n_plants(self, sample_data):
+        plant_data, state_data = sample_data
+        data_handler = PowerPlantDataHandler(plant_data, state_data)
+        result = data_handler.get_top_n_plants(1, 'Plant annual net generation (MWh)')
+
+        assert result == {'plants': [{
+            'name': 'Plant B',
+            'state': 'NY',
+            'metric': 'Plant annual net generation (MWh)',
+            'metric_value': 2000.0,
+        }]}
+
+    def test_get_top_n_plants_non_numerical_metric(self, sample_data):
+        plant_data, state_data = sample_data
+        data_handler = PowerPlantDataHandler(plant_data, state_data)
+        with pytest.raises(BadMetricError):
+            data_handler.get_top_n_plants(1, 'Plant name')
+
     def test_get_plant_metric_summary_by_state_valid_metric(self, sample_data):
         plant_data, state_data = sample_data
 
         data_handler = PowerPlantDataHandler(plant_data, state_data)
-        result = data_handler.get_plant_metric_summary_by_state('Plant annual net generation (MWh)')
+        result = orjson.loads(data_handler.get_plant_metric_summary_by_state('Plant annual net generation (MWh)'))
+
+        ca_summary = [item for item in result['summary'] if item['plant_state_abbreviation'] == 'CA'][0]
+        assert ca_summary['absolute_value'] == 1000
+        assert ca_summary['percentage'] == 10
 
-        ca_summary = [item for item in result.summary if item.plant_state_abbreviation == 'CA'][0]
-        assert ca_summary.absolute_value == 1000
-        assert ca_summary.percentage == 10
+        ny_summary = [item for item in result['summary'] if item['plant_state_abbreviation'] == 'NY'][0]
+        assert ny_summary['absolute_value'] == 2000
+        assert ny_summary['percentage'] == 10
 
-        ny_summary = [item for item in result.summary if item.plant_state_abbreviation == 'NY'][0]
-        assert ny_summary.absolute_value == 2000
-        assert ny_summary.percentage == 10
+    def test_get_plant_metric_summary_by_state_zero_state_total(self, sample_data):
+        plant_data, state_data = sample_data
+        state_data['State annual net generation (MWh)'] = ['Meta', 0, 20000]
+        data_handler = PowerPlantDataHandler(plant_data, state_data)
+        result = orjson.loads(data_handler.get_plant_metric_summary_by_state('Plant annual net generation (MWh)'))
+
+        ca_summary = [item for item in result['summary'] if item['plant_state_abbreviation'] == 'CA'][0]
+        assert ca_summary['percentage'] == 0
 
     def test_get_plant_metric_summary_by_state_invalid_metric(self, sample_data):
         plant_data, state_data = sample_data
@@ -59,3 +87,15 @@ class TestPowerPlantDataHandler:
         with pytest.raises(BadMetricError):
             data_handler.get_plant_metric_summary_by_state('Invalid State Metric')
 
+    def test_get_data_by_state_valid_state(self, sample_data):
+        plant_data, state_data = sample_data
+        data_handler = PowerPlantDataHandler(plant_data, state_data)
+        result = orjson.loads(data_handler.get_data_by_state('CA'))
+
+        assert [plant['Plant name'] for plant in result['data']] == ['Plant A']
+
+    def test_get_data_by_state_unknown_state(self, sample_data):
+        plant_data, state_data = sample_data
+        data_handler = PowerPlantDataHandler(plant_data, state_data)
+        with pytest.raises(DataNotFoundExceptionError):
+            data_handler.get_data_by_state('TX')
@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services.data_loader import _cache_path, load_sheet
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "data.xlsx"
+    sheet = pd.DataFrame({
+        "Plant name": ["Metadata", "Plant A"],
+        "Plant annual net generation (MWh)": ["Meta", "1,000"],
+    })
+    sheet.to_excel(path, sheet_name="PLNT21", index=False)
+    return path
+
+
+def test_load_sheet_uses_fresh_cache(workbook):
+    cached = pd.DataFrame({"Plant name": ["Cached"], "Plant annual net generation (MWh)": [5.0]})
+    cache = _cache_path(workbook, "PLNT21")
+    cached.to_parquet(cache)
+    workbook_mtime = workbook.stat().st_mtime
+    os.utime(cache, (workbook_mtime + 10, workbook_mtime + 10))
+
+    result = load_sheet(str(workbook), "PLNT21")
+
+    assert result["Plant name"].tolist() == ["Cached"]
+
+
+def test_load_sheet_creates_missing_cache(workbook):
+    cache = _cache_path(workbook, "PLNT21")
+
+    result = load_sheet(str(workbook), "PLNT21")
+
+    assert result["Plant name"].tolist() == ["Plant A"]
+    assert result["Plant annual net generation (MWh)"].tolist() == [1000.0]
+    assert cache.exists()
+    assert pd.read_parquet(cache)["Plant name"].tolist() == ["Plant A"]
+
+
+def test_load_sheet_rewrites_stale_cache(workbook):
+    cached = pd.DataFrame({"Plant name": ["Stale"], "Plant annual net generation (MWh)": [5.0]})
+    cache = _cache_path(workbook, "PLNT21")
+    cached.to_parquet(cache)
+    workbook_mtime = workbook.stat().st_mtime
+    os.utime(cache, (workbook_mtime - 10, workbook_mtime - 10))
+
+    result = load_sheet(str(workbook), "PLNT21")
+
+    assert result["Plant name"].tolist() == ["Plant A"]
+    assert pd.read_parquet(cache)["Plant name"].tolist() == ["Plant A"]
+
+
+def test_load_sheet_missing_workbook(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_sheet(str(tmp_path / "missing.xlsx"), "PLNT21")
@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.data_handler import PowerPlantDataHandler
+
+
+@pytest.fixture
+def client(monkeypatch):
+    plant_data = pd.DataFrame({
+        'Plant name': ['Metadata', 'Plant A', 'Plant B'],
+        'Plant state abbreviation': ['Meta', 'CA', 'NY'],
+        'Plant annual net generation (MWh)': ['Meta', 1000, 2000],
+    })
+    state_data = pd.DataFrame({
+        'State name': ['Metadata', 'CA', 'NY'],
+        'State abbreviation': ['Meta', 'CA', 'NY'],
+        'State annual net generation (MWh)': ['Meta', 10000, 20000],
+    })
+    monkeypatch.setattr(main, 'data_handler', PowerPlantDataHandler(plant_data, state_data), raising=False)
+    # Not used as a context manager, so the startup event that reads the workbook does not run
+    return TestClient(main.app)
+
+
+def test_get_top_n_plants(client):
+    response = client.get('/plants/top', params={'top_number': 1})
+    assert response.status_code == 200
+    assert [plant['name'] for plant in response.json()['plants']] == ['Plant B']
+
+
+def test_get_top_n_plants_non_positive_number(client):
+    response = client.get('/plants/top', params={'top_number': 0})
+    assert response.status_code == 422
+
+
+def test_get_states_info_missing_metric(client):
+    response = client.get('/plants/states')
+    assert response.status_code == 422
+
+
+def test_get_plants_by_state_lowercase(client):
+    response = client.get('/plants/state/ca')
+    assert response.status_code == 200
+    assert [plant['Plant name'] for plant in response.json()['data']] == ['Plant A']
+
+
+def test_get_plants_by_state_non_alphabetic(client):
+    response = client.get('/plants/state/12')
+    assert response.status_code == 422
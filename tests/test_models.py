@@ -2,7 +2,7 @@ import pytest
 from faker import Faker
 from pydantic import ValidationError
 
-from models.power_plant import (TopPowerPlant, TopPlantsRequest, StateFilterRequest, DataFrameModel)
+from models.power_plant import (TopPowerPlant, DataFrameModel)
 
 
 @pytest.fixture
@@ -21,27 +21,6 @@ def test_top_power_plant_model(faker):
 
 # Repeat similar tests for PowerPlant, StatePlantInfo, StateSummaryItem models
 
-def test_top_plants_request_model(faker):
-    data = {
-        "top_number": faker.random_int(min=1),
-        "metric": faker.word()
-    }
-    model = TopPlantsRequest(**data)
-    assert model.model_dump()  == data
-
-    with pytest.raises(ValidationError):
-        TopPlantsRequest(**{"top_number": 0, "metric": faker.word()})
-
-def test_state_filter_request_model(faker):
-    data = {
-        "state": faker.state_abbr().upper()
-    }
-    model = StateFilterRequest(**data)
-    assert model.model_dump()  == data
-
-    with pytest.raises(ValidationError):
-        StateFilterRequest(**{"state": "123"})
-
 def test_dataframe_model(faker):
     data = [{"key": faker.word(), "value": faker.word()} for _ in range(10)]
     model = DataFrameModel(data=data)
@@ -6,9 +6,10 @@ Classes:
     DataCleaner: Represents a cleaner for power plant data.
 """
 
-from typing import Union
-
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 class DataCleaner:
@@ -23,9 +24,11 @@ class DataCleaner:
            _remove_metadata_row: Removes the metadata row from the data.
            _convert_percentages: Converts percentage columns to float type and fills NaN values with 0.
            _convert_to_numerical: Converts a column to numerical type.
-           _convert_columns_to_numerical: Converts all columns to numerical type.
+           _looks_numerical: Checks whether a column looks numerical.
+           _convert_columns_to_numerical: Converts all columns that look numerical to numerical type.
            _fill_missing_values: Fills missing values in numerical columns with 0 and in categoricals with "Unknown".
            _remove_duplicates: Removes duplicate rows from the data.
+           _convert_to_arrow_dtypes: Converts the columns to PyArrow-backed dtypes.
            clean_data: Cleans the data by performing a series of operations.
     """
 
@@ -34,7 +37,7 @@ class DataCleaner:
         """
         Initialize the DataCleaner class.
 
-        :param data: The DataFrame to be cleaned.
+        :param data: The DataFrame to be cleaned. It is modified in place to avoid copying it.
         """
         self.data = data
         self.percentage_columns = [col for col in self.data.columns if 'percent' in col.lower()]
@@ -43,45 +46,76 @@ class DataCleaner:
         """
         Remove the metadata row from the DataFrame.
         """
-        self.data = self.data.iloc[1:]
-        self.data.reset_index(drop=True, inplace=True)
+        self.data.drop(index=self.data.index[0], inplace=True)
 
     def _convert_percentages(self) -> None:
         """
         Convert percentage columns to float type and fill NaN values with 0.
         """
-        for col in self.percentage_columns:
-            self.data.loc[:, col] = self.data[col].astype(str).str.rstrip('%').astype('float') / 100
-        self.data.loc[:, self.percentage_columns] = self.data[self.percentage_columns].fillna(0)
+        if not self.percentage_columns:
+            return
+        # Strip all percentage columns in a single vectorized pass over one string array
+        values = np.char.rstrip(self.data[self.percentage_columns].to_numpy(dtype=str), '%')
+        percentages = values.astype(np.float64) / 100
+        percentages[np.isnan(percentages)] = 0
+        self.data[self.percentage_columns] = percentages
 
     @staticmethod
-    def _convert_to_numerical(col: Union[pd.Series, pd.DataFrame]) -> Union[pd.Series, pd.DataFrame]:
+    def _convert_to_numerical(col: pd.Series) -> pd.Series:
         """
         Convert a column to numerical type.
 
+        The thousands separators and surrounding whitespace are stripped with Arrow's string kernels instead of a
+        pandas regex.
+
         :param col: The column to be converted.
-        :return: The converted column.
+        :return: The converted column, or the original column if it is not numerical.
         """
         try:
-            return col.replace(',', '', regex=True).astype(float)
-        except:  # pylint: disable=bare-except
+            array = pa.array(col, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Excel columns can mix number cells with text cells, so the non-missing values are parsed as strings
+            array = pa.array(col.astype(str), mask=col.isna().to_numpy(), type=pa.string())
+        try:
+            if pa.types.is_string(array.type):
+                array = pc.replace_substring(pc.utf8_trim_whitespace(array), ',', '')
+            array = pc.cast(array, pa.float64(), safe=False)
+        except pa.ArrowException:
             return col
+        return pd.Series(array.to_numpy(zero_copy_only=False), index=col.index, name=col.name)
+
+    @staticmethod
+    def _looks_numerical(col: pd.Series) -> bool:
+        """
+        Check whether a column looks numerical based on its first non-missing values.
+
+        :param col: The column to be checked.
+        :return: True if the sampled values parse as numbers once commas and surrounding whitespace are removed.
+        """
+        try:
+            for value in col.dropna().iloc[:5]:
+                float(str(value).replace(',', '').strip())
+        except ValueError:
+            return False
+        return True
 
     def _convert_columns_to_numerical(self) -> None:
         """
-        Convert all columns to numerical type.
+        Convert all columns that look numerical to numerical type.
         """
-        self.data = self.data.apply(self._convert_to_numerical)
+        object_columns = self.data.select_dtypes(include=['object']).columns
+        for col in object_columns:
+            if self._looks_numerical(self.data[col]):
+                self.data[col] = self._convert_to_numerical(self.data[col])
 
     def _fill_missing_values(self) -> None:
         """
         Fill missing values in numerical columns with 0 and in categorical columns with "Unknown".
         """
         numerical_columns = self.data.select_dtypes(include=['float64', 'int64']).columns
-        self.data[numerical_columns] = self.data[numerical_columns].fillna(0)
-        self.data[numerical_columns] = self.data[numerical_columns].dropna()
         categorical_columns = self.data.select_dtypes(include=['object']).columns
-        self.data[categorical_columns] = self.data[categorical_columns].fillna("Unknown")
+        fill_values = {**dict.fromkeys(numerical_columns, 0), **dict.fromkeys(categorical_columns, "Unknown")}
+        self.data.fillna(fill_values, inplace=True)
 
     def _remove_duplicates(self) -> None:
         """
@@ -89,6 +123,12 @@ class DataCleaner:
         """
         self.data.drop_duplicates(inplace=True)
 
+    def _convert_to_arrow_dtypes(self) -> None:
+        """
+        Convert the columns to PyArrow-backed dtypes, keeping floats as floats.
+        """
+        self.data = self.data.convert_dtypes(dtype_backend="pyarrow", convert_integer=False)
+
     def clean_data(self) -> pd.DataFrame:
         """
         Clean the DataFrame by performing a series of operations.
@@ -100,4 +140,5 @@ class DataCleaner:
         self._convert_columns_to_numerical()
         self._fill_missing_values()
         self._remove_duplicates()
+        self._convert_to_arrow_dtypes()
         return self.data